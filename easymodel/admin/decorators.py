@@ -1,7 +1,10 @@
+from itertools import product
+
 from django.contrib.admin.options import BaseModelAdmin
 from django.contrib.admin.util import flatten_fieldsets
 from django.contrib.contenttypes.generic import generic_inlineformset_factory, BaseGenericInlineFormSet
 from django.db.models.base import ModelBase
+from django.utils.translation import get_language
 
 from easymodel.admin import forms
 from easymodel.admin.generic import LocalizableGenericInlineFormSet
@@ -10,8 +13,22 @@ from easymodel.utils.languagecode import get_all_language_codes, localize_fieldn
 
 __all__ = ('L10n', 'lazy_localized_list')
 
+# admin classes that have allready been localised, keyed by (model, admin class)
+_L10N_CACHE = {}
+
+# admin classes created by the inline syntax, keyed by (admin class, model)
+_DESCENDANT_CACHE = {}
+
 def compute_prohibited(fields, exclude, localized):
-    return set(fields) - set(exclude) - set(localized)
+    """
+    returns the fields that are neither excluded nor localized.
+    
+    fields is filtered in a single pass, exclude and localized are only
+    copied when they are not frozensets allready.
+    """
+    exclude = frozenset(exclude)
+    localized = frozenset(localized)
+    return {f for f in fields if f not in exclude and f not in localized}
 
 class lazy_localized_list(list):
     """
@@ -19,6 +36,8 @@ class lazy_localized_list(list):
     undetected. It will give the 'real' name of an internationalized
     property when localized.
     """
+    
+    __slots__ = ('localized_fieldnames', '_cache', '_noop')
 
     def __new__(cls, sequence, localized_fieldnames):
         if type(sequence) is lazy_localized_list:
@@ -26,15 +45,33 @@ class lazy_localized_list(list):
         return list.__new__(cls, sequence)
         
     def __init__(self, sequence, localized_fieldnames):
+        # __new__ returned an existing lazy_localized_list, which is allready
+        # initialized. list.__init__ would empty it.
+        if sequence is self:
+            return
+        
         self.localized_fieldnames = localized_fieldnames
+        # localized versions of the list, keyed by language
+        self._cache = {}
         super(lazy_localized_list, self).__init__(sequence)
+        # none of the items are localized, so they can be returned as is
+        self._noop = not any(name in localized_fieldnames for name in self)
     
     def __get__(self, obj, typ=None):
         """
         returns a localized version of the list this descriptor
         was initialized with.
         """
-        return localize_fieldnames(self, self.localized_fieldnames)
+        if self._noop:
+            return list(self)
+        
+        language = get_language()
+        localized = self._cache.get(language)
+        if localized is None:
+            localized = tuple(localize_fieldnames(self, self.localized_fieldnames))
+            self._cache[language] = localized
+        # callers get their own list, so changing it does not affect other requests
+        return list(localized)
 
 class L10n(object):
     """
@@ -96,7 +133,11 @@ class L10n(object):
         # when using inline syntax we need a new type, otherwise we could modify django's ModelAdmin!
         # inline_syntax is using L10n as: L10n(ModelAdmin, Model)
         if inline_syntax:
-            descendant = type(obj.model.__name__ + cls.__name__, (cls,), {'model':obj.model})
+            key = (cls, obj.model)
+            descendant = _DESCENDANT_CACHE.get(key)
+            if descendant is None:
+                descendant = type(obj.model.__name__ + cls.__name__, (cls,), {'model':obj.model})
+                _DESCENDANT_CACHE[key] = descendant
             return obj.__call__(descendant)
         elif cls: # if cls is defined call __call__ to localize admin class.
             if not hasattr(cls, 'model'):
@@ -114,14 +155,19 @@ class L10n(object):
         elif not self.model:
             raise AttributeError(L10n.error_no_model % (cls.__name__) )
 
+        # never localise the same admin class for the same model twice
+        key = (self.model, cls)
+        if key in _L10N_CACHE:
+            return _L10N_CACHE[key]
+
         # gather names of fields added by I18n
-        added_fields = []
-        for field in self.model.localized_fields:
-            for language in get_all_language_codes():
-                added_fields.append(get_real_fieldname(field, language))
+        added_fields = [get_real_fieldname(field, language) for field, language
+            in product(self.model.localized_fields, get_all_language_codes())]
 
         # hide added fields from form and admin
-        cls.exclude = added_fields
+        cls.exclude = tuple(added_fields)
+        # frozenset shadow of exclude, used for fast membership tests
+        cls._exclude_set = frozenset(added_fields)
         cls.form = forms.make_localised_form(self.model, cls.form, exclude=added_fields)
 
         # determine name of the permission to edit untranslated fields
@@ -129,15 +175,24 @@ class L10n(object):
             self.model._meta.app_label, self.model.__name__.lower()
         )
         
+        # none of these depend on the request, so compute them only once
+        default_fields = tuple(f.name for f in self.model._meta.fields)
+        pk_index = self.model._meta.fields.index(self.model._meta.pk)
+        localized_fields = frozenset(self.model.localized_fields)
+        
         # make sure that fields become read_only when no permission is given.
         def get_readonly_fields(self, request, obj=None):
             if not request.user.has_perm(permisson_name):
-                fields = self.fields or map(lambda x: x.name, self.model._meta.fields)
+                fields = list(self.fields or default_fields)
                 # remove primary key because we don't show that, not even uneditable
-                fields.pop(self.model._meta.pk_index())
-                prohibited_fields = compute_prohibited(fields, self.exclude, self.model.localized_fields)
+                del fields[pk_index]
+                if self.exclude is cls.exclude:
+                    exclude = self._exclude_set
+                else: # exclude was overridden after localising
+                    exclude = frozenset(self.exclude or ())
+                prohibited_fields = compute_prohibited(fields, exclude, localized_fields)
                 
-                return set(self.readonly_fields).union(prohibited_fields)
+                return frozenset(self.readonly_fields).union(prohibited_fields)
             
             return self.readonly_fields
         
@@ -147,8 +202,9 @@ class L10n(object):
         if hasattr(cls, 'change_view'):
             # BaseModelAdmin.__init__ will mess up our lazy lists if the following is
             # not allready defined
-            if 'action_checkbox' not in cls.list_display and cls.actions is not None:
-                cls.list_display = ['action_checkbox'] +  list(cls.list_display)
+            list_display = cls.list_display
+            if 'action_checkbox' not in list_display and cls.actions is not None:
+                cls.list_display = ('action_checkbox', *list_display)
             
             if not cls.list_display_links:
                 for name in cls.list_display:
@@ -206,5 +262,5 @@ class L10n(object):
             
             cls.get_formset = get_formset
         
-            
+        _L10N_CACHE[key] = cls
         return cls
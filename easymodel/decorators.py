@@ -1,8 +1,3 @@
-import os
-import sys
-
-from django.conf import settings
-
 from easymodel import meta
 
 
@@ -33,9 +28,13 @@ class I18n(object):
         cls = meta.localize_fields(cls, self.localized_fields)
         
         # add permission for editing the untranslated fields in this model
-        perm = (("can_edit_untranslated_fields_of_%s" % cls.__name__.lower(),
-            "Can edit untranslated fields"),)
-        # cast to same type as cls.meta.permissions (tuple or list) before add
-        cls._meta.permissions += type(cls._meta.permissions)(perm)
+        perm = ("can_edit_untranslated_fields_of_%s" % cls.__name__.lower(),
+            "Can edit untranslated fields")
+        # add as the same type as cls.meta.permissions (tuple or list)
+        permissions = cls._meta.permissions
+        if isinstance(permissions, tuple):
+            cls._meta.permissions = permissions + (perm,)
+        else:
+            cls._meta.permissions = permissions + [perm]
 
         return cls
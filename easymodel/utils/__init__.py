@@ -23,9 +23,4 @@ def first_match(predicate, lst):
     :param list: A list of items that can serve as input to ``predicate``.
     :rtype: whatever ``predicate`` returns instead of None. (or None).
     """
-    for item in lst:
-        val = predicate(item)
-        if val is not None:
-            return val
-
-    return None
\ No newline at end of file
+    return next((val for val in map(predicate, lst) if val is not None), None)
@@ -3,6 +3,8 @@ Lots of utility functions that can be used when
 implementing a multi lingual django app.
 """
 import re
+import sys
+from functools import lru_cache
 
 from django.conf import settings
 from django.utils.translation import get_language, to_locale
@@ -44,6 +46,7 @@ if USE_SHORT_LANGUAGE_CODES:
 else:
     STRIP_LANGUAGE_CODE_REGEX = re.compile(r'/(?:%s)/' % "|".join(get_language_codes()))
 
+@lru_cache(maxsize=None)
 def get_all_language_codes():
     """
     Returns all language codes defined in settings.LANGUAGES and also the
@@ -55,14 +58,19 @@ def get_all_language_codes():
     >>> sorted( get_language_codes() )
     ['en-us', 'en','de', 'nl-be','fr-be']
     
-    :rtype: A :class:`list` of language codes.
+    The result is cached, ``settings.LANGUAGES`` is not supposed to
+    change at runtime.
+    
+    :rtype: A :class:`tuple` of language codes.
     """
-    languages = get_language_codes()
+    languages = list(get_language_codes())
     if hasattr(settings, 'MSGID_LANGUAGE'):
         if not settings.MSGID_LANGUAGE in languages:
             languages.insert(0, settings.MSGID_LANGUAGE)
             
-    return languages
+    # lazy or subclassed strings can not be interned
+    return tuple(sys.intern(language) if type(language) is str else language
+        for language in languages)
 
 def get_shorthand_from_language_code(locale):
     """
@@ -151,6 +159,7 @@ def fix_language_code(url, current_language):
     # add the language code to the url        
     return u"/%s%s" % (get_shorthand_from_language_code(current_language), stripped_url)
 
+@lru_cache(maxsize=1024)
 def get_real_fieldname(field, lang):
     """
     Depending on the language a field can have a different name.